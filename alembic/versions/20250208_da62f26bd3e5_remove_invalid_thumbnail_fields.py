@@ -8,6 +8,7 @@ Create Date: 2025-02-08 14:51:32.548474
 
 from typing import TYPE_CHECKING
 
+import sqlalchemy as sa
 from alembic import op
 
 if TYPE_CHECKING:
@@ -19,9 +20,29 @@ down_revision: str | None = "04239faf8d5b"
 branch_labels: str | Sequence[str] | None = None
 depends_on: str | Sequence[str] | None = None
 
+BATCH_SIZE = 10000
+
 
 def upgrade() -> None:
-    op.execute("UPDATE article SET media_description = NULL, media_thumbnail = NULL")
+    # Walk the table in rowid ranges and commit each batch, to keep the WAL small.
+    # Each batch starts where the previous one ended, so no rows are scanned twice.
+    batch_end = sa.text(
+        "SELECT MAX(id) FROM (SELECT id FROM article WHERE id > :last_id ORDER BY id LIMIT :batch_size)"
+    )
+    clear_batch = sa.text("""
+        UPDATE article SET media_description = NULL, media_thumbnail = NULL
+        WHERE id > :last_id AND id <= :batch_end
+        AND (media_description IS NOT NULL OR media_thumbnail IS NOT NULL)
+    """)
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        last_id = 0
+        while True:
+            end_id = bind.execute(batch_end, {"last_id": last_id, "batch_size": BATCH_SIZE}).scalar()
+            if end_id is None:
+                break
+            bind.execute(clear_batch, {"last_id": last_id, "batch_end": end_id})
+            last_id = end_id
 
 
 def downgrade() -> None:
@@ -23,7 +23,7 @@ depends_on: str | Sequence[str] | None = None
 
 def upgrade() -> None:
     op.add_column("folder", sa.Column("is_root", sa.Boolean(), nullable=False, server_default=sa.false()))
-    op.execute("INSERT INTO folder (id, name, is_root) VALUES (0, '', true)")
+    op.execute("INSERT OR IGNORE INTO folder (id, name, is_root) VALUES (0, '', 1)")
     op.execute("UPDATE feed SET folder_id = 0 WHERE folder_id IS NULL")
 
 
@@ -8,6 +8,7 @@ Create Date: 2025-11-11 19:51:48.365034
 
 from typing import TYPE_CHECKING
 
+import sqlalchemy as sa
 from alembic import op
 
 if TYPE_CHECKING:
@@ -19,13 +20,34 @@ down_revision: str | None = "70f699292c8b"
 branch_labels: str | Sequence[str] | None = None
 depends_on: str | Sequence[str] | None = None
 
+BATCH_SIZE = 5000
+
 
 def upgrade() -> None:
-    op.execute("""
+    # Per-feed article queries benefit from an index on article.feed_id, so it is created here.
+    op.create_index("ix_article_feed_id", "article", ["feed_id"], if_not_exists=True)
+
+    # Delete in rowid ranges that are committed one by one, so that the write lock is only held briefly
+    # and the WAL does not grow to the size of all orphaned articles. Each batch starts where the previous
+    # one ended, so no rows are scanned twice.
+    batch_end = sa.text(
+        "SELECT MAX(id) FROM (SELECT id FROM article WHERE id > :last_id ORDER BY id LIMIT :batch_size)"
+    )
+    delete_batch = sa.text("""
         DELETE FROM article
-        WHERE feed_id NOT IN (SELECT id FROM feed)
+        WHERE id > :last_id AND id <= :batch_end
+        AND NOT EXISTS (SELECT 1 FROM feed WHERE feed.id = article.feed_id)
     """)
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        last_id = 0
+        while True:
+            end_id = bind.execute(batch_end, {"last_id": last_id, "batch_size": BATCH_SIZE}).scalar()
+            if end_id is None:
+                break
+            bind.execute(delete_batch, {"last_id": last_id, "batch_end": end_id})
+            last_id = end_id
 
 
 def downgrade() -> None:
-    pass
+    op.drop_index("ix_article_feed_id", table_name="article", if_exists=True)
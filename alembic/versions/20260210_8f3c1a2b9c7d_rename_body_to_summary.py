@@ -22,20 +22,9 @@ depends_on: str | Sequence[str] | None = None
 
 
 def upgrade() -> None:
-    with op.batch_alter_table("article") as batch_op:
-        batch_op.add_column(sa.Column("summary", sa.String(), nullable=True))
-
-    op.execute("UPDATE article SET summary = body WHERE summary IS NULL")
-
-    with op.batch_alter_table("article") as batch_op:
-        batch_op.drop_column("body")
+    # SQLite supports renaming columns in place, so neither a table rebuild nor a data copy is needed.
+    op.alter_column("article", "body", new_column_name="summary", existing_type=sa.String(), existing_nullable=True)
 
 
 def downgrade() -> None:
-    with op.batch_alter_table("article") as batch_op:
-        batch_op.add_column(sa.Column("body", sa.String(), nullable=True))
-
-    op.execute("UPDATE article SET body = summary WHERE body IS NULL")
-
-    with op.batch_alter_table("article") as batch_op:
-        batch_op.drop_column("summary")
+    op.alter_column("article", "summary", new_column_name="body", existing_type=sa.String(), existing_nullable=True)
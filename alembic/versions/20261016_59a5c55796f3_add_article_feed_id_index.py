@@ -0,0 +1,30 @@
+"""Add index on article.feed_id
+
+Revision ID: 59a5c55796f3
+Revises: 8f3c1a2b9c7d
+Create Date: 2026-10-16 09:12:41.218304
+
+"""
+
+from typing import TYPE_CHECKING
+
+from alembic import op
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# revision identifiers, used by Alembic.
+revision: str = "59a5c55796f3"
+down_revision: str | None = "8f3c1a2b9c7d"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Databases created after 3abc0ae31458 was applied never got this index, so add it if it is missing.
+    op.create_index("ix_article_feed_id", "article", ["feed_id"], if_not_exists=True)
+
+
+def downgrade() -> None:
+    # The index belongs to 3abc0ae31458, which drops it on its own downgrade.
+    pass
@@ -0,0 +1,36 @@
+"""Add indexes for feed article queries and folder lookups
+
+Revision ID: b7e2d41c9a06
+Revises: 59a5c55796f3
+Create Date: 2026-10-16 10:04:27.551930
+
+"""
+
+from typing import TYPE_CHECKING
+
+import sqlalchemy as sa
+from alembic import op
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e2d41c9a06"
+down_revision: str | None = "59a5c55796f3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_article_feed_id_pub_date", "article", ["feed_id", "pub_date"], if_not_exists=True)
+    # Partial index, so it only grows with the unread articles that the item listings ask for.
+    op.create_index(
+        "ix_article_feed_unread", "article", ["feed_id"], sqlite_where=sa.text("unread = 1"), if_not_exists=True
+    )
+    op.create_index("ix_feed_folder_id", "feed", ["folder_id"], if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_feed_folder_id", table_name="feed", if_exists=True)
+    op.drop_index("ix_article_feed_unread", table_name="article", if_exists=True)
+    op.drop_index("ix_article_feed_id_pub_date", table_name="article", if_exists=True)
@@ -0,0 +1,32 @@
+"""Add partial index for starred articles
+
+Revision ID: c3a9f0d2e815
+Revises: b7e2d41c9a06
+Create Date: 2026-10-16 11:26:03.118472
+
+"""
+
+from typing import TYPE_CHECKING
+
+import sqlalchemy as sa
+from alembic import op
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# revision identifiers, used by Alembic.
+revision: str = "c3a9f0d2e815"
+down_revision: str | None = "b7e2d41c9a06"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Entries are ordered by rowid, so the starred listing is answered by a range scan in id order.
+    op.create_index(
+        "ix_article_starred", "article", ["starred"], sqlite_where=sa.text("starred = 1"), if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_article_starred", table_name="article", if_exists=True)
@@ -0,0 +1,31 @@
+"""Add HTTP cache validators to feed
+
+Revision ID: d41e7b5a03c2
+Revises: c3a9f0d2e815
+Create Date: 2026-10-16 12:41:55.730184
+
+"""
+
+from typing import TYPE_CHECKING
+
+import sqlalchemy as sa
+from alembic import op
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# revision identifiers, used by Alembic.
+revision: str = "d41e7b5a03c2"
+down_revision: str | None = "c3a9f0d2e815"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("feed", sa.Column("http_etag", sa.String(), nullable=True))
+    op.add_column("feed", sa.Column("http_last_modified", sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("feed", "http_last_modified")
+    op.drop_column("feed", "http_etag")
@@ -0,0 +1,30 @@
+"""Add index on article guid_hash and feed_id
+
+Revision ID: e82f6c4d1b57
+Revises: d41e7b5a03c2
+Create Date: 2026-10-16 13:04:52.637190
+
+"""
+
+from typing import TYPE_CHECKING
+
+from alembic import op
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# revision identifiers, used by Alembic.
+revision: str = "e82f6c4d1b57"
+down_revision: str | None = "d41e7b5a03c2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Leading with guid_hash serves both the feed update lookup by guid_hash alone
+    # and the star/unstar lookups by (feed_id, guid_hash).
+    op.create_index("ix_article_guid_hash_feed_id", "article", ["guid_hash", "feed_id"], if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_article_guid_hash_feed_id", table_name="article", if_exists=True)
@@ -1,8 +1,9 @@
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from pathlib import Path
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi_utilities import repeat_every  # type: ignore
 
@@ -46,13 +47,22 @@ app.add_middleware(
 app.include_router(nextcloud_router, prefix="/index.php/apps/news/api")
 
 
+_status_ok = b'{"status":"ok"}'
+
+
 @app.get("/status")
-def status():
-    """Status endpoint to check if the service is running."""
-    return {"status": "ok"}
+async def status() -> Response:
+    """Status endpoint to check if the service is running.
+
+    The body is constant, so it is returned pre-serialized and without a detour through the thread pool.
+    """
+    return Response(content=_status_ok, media_type="application/json")
 
 
 @repeat_every(seconds=Options.get().feed_update_frequency_min * 60)
 async def update_feeds() -> None:
-    """Update all feeds."""
-    feed.update_all()
+    """Update all feeds.
+
+    The update is blocking, so it runs in a worker thread to keep the event loop free for requests.
+    """
+    await asyncio.to_thread(feed.update_all)
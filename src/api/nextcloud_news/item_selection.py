@@ -0,0 +1,61 @@
+"""Item selection shared by the item endpoints of all API versions"""
+
+import enum
+from collections.abc import Callable
+from typing import Concatenate, Protocol
+
+from fastapi import HTTPException
+
+from src import article, database
+
+
+class FeedSelectionMethod(enum.Enum):
+    FEED = 0
+    FOLDER = 1
+    STARRED = 2
+    ALL = 3
+
+
+class ItemSelector(Protocol):
+    def __call__(
+        self,
+        selection_id: int,
+        /,
+        *,
+        max_results: int = 0,
+        newest_item_id: int = 0,
+        get_read: bool = True,
+        oldest_first: bool = True,
+        last_modified: int = 0,
+    ) -> list[database.Article]: ...
+
+
+def _ignoring_selection_id[**P](
+    select: Callable[P, list[database.Article]],
+) -> Callable[Concatenate[int, P], list[database.Article]]:
+    def select_ignoring_selection_id(selection_id: int, /, *args: P.args, **kwargs: P.kwargs) -> list[database.Article]:
+        return select(*args, **kwargs)
+
+    return select_ignoring_selection_id
+
+
+# Keyed by the raw `type` query parameter, so requests skip the enum conversion and unknown types are rejected
+_item_selectors: dict[int, ItemSelector] = {
+    FeedSelectionMethod.FEED.value: article.get_by_feed,
+    FeedSelectionMethod.FOLDER.value: article.get_by_folder,
+    FeedSelectionMethod.STARRED.value: _ignoring_selection_id(article.get_starred),
+    FeedSelectionMethod.ALL.value: _ignoring_selection_id(article.get_all),
+}
+
+
+def get_item_selector(selection_type: int) -> ItemSelector:
+    """Get the function that fetches the items for a selection type.
+
+    :param selection_type: The type of selection method (0: FEED, 1: FOLDER, 2: STARRED, 3: ALL).
+    :returns: The function to call with the ID of the feed or folder and the item filters.
+    :raises HTTPException: If the selection type is unknown.
+    """
+    try:
+        return _item_selectors[selection_type]
+    except KeyError:
+        raise HTTPException(status_code=422, detail=f"Unknown selection type {selection_type}") from None
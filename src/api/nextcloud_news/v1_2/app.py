@@ -1,5 +1,6 @@
 """API"""
 
+import secrets
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -32,7 +33,10 @@ def get_current_username(credentials: Annotated[HTTPBasicCredentials, Depends(se
             detail="Not authenticated",
             headers={"WWW-Authenticate": "Basic"},
         )
-    if credentials.username != username or credentials.password != password:
+    # Compare in constant time and evaluate both comparisons to not leak which of them failed
+    username_matches = secrets.compare_digest(credentials.username.encode(), username.encode())
+    password_matches = secrets.compare_digest(credentials.password.encode(), password.encode())
+    if not (username_matches & password_matches):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication credentials",
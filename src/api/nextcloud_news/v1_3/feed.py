@@ -56,7 +56,7 @@ def get_feeds() -> FeedGetOut:
     for f in feeds:
         if f.folder_id == root_folder_id:
             f.folder_id = None  # type: ignore
-    return FeedGetOut(feeds=[Feed.model_validate(feed) for feed in feeds])
+    return FeedGetOut.model_validate({"feeds": feeds})
 
 
 class FeedPostIn(BaseModel):
@@ -84,7 +84,8 @@ class FeedPostOut(BaseModel):
 @router.post("", response_model=FeedPostOut)
 def add_feed(input: FeedPostIn):
     """Add a new feed."""
-    folder_id = input.folder_id or folder.get_root_folder_id()
+    root_folder_id = folder.get_root_folder_id()
+    folder_id = input.folder_id or root_folder_id
     logger.info(f"Adding feed with URL `{input.url}` to folder {folder_id}")
     try:
         new_feed = feed.add(url=input.url, folder_id=folder_id)
@@ -97,7 +98,11 @@ def add_feed(input: FeedPostIn):
     except content.SSRFProtectionError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
 
-    return {"feeds": get_feeds().feeds, "newestItemId": new_feed.id}
+    # Like Nextcloud News, only return the added feed instead of the full feed list
+    new_feed_out = Feed.model_validate(new_feed)
+    if new_feed_out.folder_id == root_folder_id:
+        new_feed_out.folder_id = None
+    return FeedPostOut(feeds=[new_feed_out], newest_item_id=new_feed.id)
 
 
 @router.delete("/{feed_id}")
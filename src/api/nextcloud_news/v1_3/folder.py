@@ -4,7 +4,7 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, ConfigDict
 from pydantic.alias_generators import to_camel
 
-from src import database, folder
+from src import article, folder
 
 router = APIRouter(tags=["folders"])
 logger = logging.getLogger(__name__)
@@ -39,7 +39,7 @@ def get_folders() -> FolderGetOut:
     """
     logger.info("Fetching all folders")
     folders = folder.get_all(include_root=False)
-    return FolderGetOut(folders=[Folder.model_validate(folder) for folder in folders])
+    return FolderGetOut.model_validate({"folders": folders})
 
 
 class FolderPostIn(BaseModel):
@@ -131,18 +131,7 @@ def mark_items_read(folder_id: int, input: MarkItemsReadIn):
     :raises HTTPException: If the folder is not found.
     """
     logger.info(f"Marking items as read in folder with ID {folder_id} until item ID {input.newest_item_id}")
-    with database.get_session() as db:
-        folder = db.query(database.Folder).filter(database.Folder.id == folder_id).first()
-        if not folder:
-            raise HTTPException(status_code=404, detail="Folder not found")
-
-        items = (
-            db.query(database.Article)
-            .join(database.Feed)
-            .filter(database.Feed.folder_id == folder_id)
-            .filter(database.Article.id <= input.newest_item_id)
-            .all()
-        )
-        for item in items:
-            item.unread = False
-        db.commit()
+    try:
+        article.mark_read_by_folder(folder_id, input.newest_item_id)
+    except folder.NoFolderError:
+        raise HTTPException(status_code=404, detail="Folder not found") from None
@@ -1,6 +1,5 @@
 """API Endpoints under /feeds/"""
 
-import enum
 import logging
 
 from fastapi import APIRouter, HTTPException
@@ -9,6 +8,8 @@ from pydantic.alias_generators import to_camel
 
 from src import article, database
 
+from ..item_selection import get_item_selector
+
 logger = logging.getLogger(__name__)
 
 
@@ -90,13 +91,6 @@ class ItemContentOut(BaseModel):
     )
 
 
-class FeedSelectionMethod(enum.Enum):
-    FEED = 0
-    FOLDER = 1
-    STARRED = 2
-    ALL = 3
-
-
 @router.get("", response_model=ItemGetOut)
 def get_items(
     batchSize: int = -1,  # noqa: N803
@@ -118,44 +112,14 @@ def get_items(
     :param lastModified: The timestamp to filter items by last modified date.
     :returns: A list of items matching the criteria.
     """
-    select_method = FeedSelectionMethod(type)
-
-    if select_method == FeedSelectionMethod.FEED:
-        items = article.get_by_feed(
-            feed_id=id,
-            max_results=batchSize,
-            newest_item_id=offset,
-            get_read=getRead,
-            oldest_first=oldestFirst,
-            last_modified=lastModified,
-        )
-    elif select_method == FeedSelectionMethod.FOLDER:
-        items = article.get_by_folder(
-            folder_id=id,
-            max_results=batchSize,
-            newest_item_id=offset,
-            get_read=getRead,
-            oldest_first=oldestFirst,
-            last_modified=lastModified,
-        )
-    elif select_method == FeedSelectionMethod.STARRED:
-        items = article.get_starred(
-            max_results=batchSize,
-            newest_item_id=offset,
-            get_read=getRead,
-            oldest_first=oldestFirst,
-            last_modified=lastModified,
-        )
-    elif select_method == FeedSelectionMethod.ALL:
-        items = article.get_all(
-            max_results=batchSize,
-            newest_item_id=offset,
-            get_read=getRead,
-            oldest_first=oldestFirst,
-            last_modified=lastModified,
-        )
-    else:
-        raise NotImplementedError(f"Article selection method {select_method} is not implemented")
+    items = get_item_selector(type)(
+        id,
+        max_results=batchSize,
+        newest_item_id=offset,
+        get_read=getRead,
+        oldest_first=oldestFirst,
+        last_modified=lastModified,
+    )
 
     return ItemGetOut(items=[_article_to_item(item) for item in items])
 
@@ -173,18 +137,7 @@ def get_updated_items(
     :param id: The ID of the feed or folder.
     :returns: A list of items matching the criteria.
     """
-    select_method = FeedSelectionMethod(type)
-
-    if select_method == FeedSelectionMethod.FEED:
-        items = article.get_by_feed(feed_id=id, oldest_first=False, last_modified=lastModified)
-    elif select_method == FeedSelectionMethod.FOLDER:
-        items = article.get_by_folder(folder_id=id, oldest_first=False, last_modified=lastModified)
-    elif select_method == FeedSelectionMethod.STARRED:
-        items = article.get_starred(oldest_first=False, last_modified=lastModified)
-    elif select_method == FeedSelectionMethod.ALL:
-        items = article.get_all(oldest_first=False, last_modified=lastModified)
-    else:
-        raise NotImplementedError(f"Article selection method {select_method} is not implemented")
+    items = get_item_selector(type)(id, oldest_first=False, last_modified=lastModified)
 
     return ItemGetOut(items=[_article_to_item(item) for item in items])
 
@@ -233,7 +186,7 @@ def mark_multiple_items_as_read(input: ItemIDListIn) -> None:
 
     :param input: The list of item IDs to mark as read.
     """
-    logger.info(f"Marking multiple items as read: {input.item_ids}")
+    logger.info(f"Marking {len(input.item_ids)} items as read")
     article.mark_as_read(input.item_ids)
 
 
@@ -256,7 +209,7 @@ def mark_multiple_items_as_unread(input: ItemIDListIn) -> None:
 
     :param input: The list of item IDs to mark as unread.
     """
-    logger.info(f"Marking multiple items as unread: {input.item_ids}")
+    logger.info(f"Marking {len(input.item_ids)} items as unread")
     article.mark_as_unread(input.item_ids)
 
 
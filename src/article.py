@@ -2,18 +2,23 @@ import logging
 import re
 import time
 from hashlib import md5
+from itertools import batched
 
 from src import database
 from src.content import (
     extract_article,
     summarize_article_with_llm,
 )
+from src.folder import NoFolderError
 from src.options import Options
 
 logger = logging.getLogger(__name__)
 
 LLM_SUMMARY_MIN_CHARS = 160
 
+# Older SQLite versions allow at most 999 bound parameters per statement
+max_ids_per_statement = 900
+
 
 class NoArticleError(Exception):
     """Raised when an article is not found in the database."""
@@ -111,22 +116,31 @@ def _create_fingerprint(content: str | None, title: str | None, url: str | None)
 def mark_read_by_feed(feed_id: int, newest_item_id: int) -> None:
     """Mark items from a feed older than a given item as read."""
     with database.get_session() as db:
-        feed = db.query(database.Feed).filter(database.Feed.id == feed_id).first()
-        if not feed:
+        if not db.query(database.Feed.id).filter(database.Feed.id == feed_id).first():
             from src.feed import NoFeedError
 
             raise NoFeedError(f"No feed with ID {feed_id} exists")
 
-        items = (
-            db.query(database.Article)
-            .filter(database.Article.feed_id == feed_id)
-            .filter(database.Article.id <= newest_item_id)
-            .all()
-        )
+        db.query(database.Article).filter(
+            database.Article.feed_id == feed_id,
+            database.Article.id <= newest_item_id,
+            database.Article.unread,
+        ).update({"unread": False, "last_modified": now()}, synchronize_session=False)
+        db.commit()
 
-        for item in items:
-            item.unread = False
 
+def mark_read_by_folder(folder_id: int, newest_item_id: int) -> None:
+    """Mark items from the feeds in a folder older than a given item as read."""
+    with database.get_session() as db:
+        if not db.query(database.Folder.id).filter(database.Folder.id == folder_id).first():
+            raise NoFolderError(f"No folder with ID {folder_id} exists")
+
+        folder_feed_ids = db.query(database.Feed.id).filter(database.Feed.folder_id == folder_id)
+        db.query(database.Article).filter(
+            database.Article.feed_id.in_(folder_feed_ids.scalar_subquery()),
+            database.Article.id <= newest_item_id,
+            database.Article.unread,
+        ).update({"unread": False, "last_modified": now()}, synchronize_session=False)
         db.commit()
 
 
@@ -171,7 +185,8 @@ def get_by_folder(
 ) -> list[database.Article]:
     """Fetch items based on the provided parameters."""
     with database.get_session() as db:
-        query = db.query(database.Article).join(database.Feed).filter(database.Feed.folder_id == folder_id)
+        folder_feed_ids = db.query(database.Feed.id).filter(database.Feed.folder_id == folder_id)
+        query = db.query(database.Article).filter(database.Article.feed_id.in_(folder_feed_ids.scalar_subquery()))
         items = _filter_article_query(query, max_results, newest_item_id, get_read, oldest_first, last_modified)
 
     return items
@@ -192,18 +207,27 @@ def get_starred(
     return items
 
 
-def get_by_guid_hash(feedId: int, guidHash: str) -> database.Article:  # noqa: N803
-    """Fetch an item by its GUID hash."""
+def get_ids_by_guid_hashes(items: list[tuple[int, str]]) -> list[int]:
+    """Fetch the IDs of items by their feed ID and GUID hash with one query per batch of items.
+
+    :param items: The (feed ID, GUID hash) pairs of the items.
+    :returns: The IDs of the items, in the order of the given pairs.
+    :raises NoArticleError: If any of the items does not exist.
+    """
+    ids: dict[tuple[int, str], int] = {}
     with database.get_session() as db:
-        item = (
-            db.query(database.Article)
-            .filter(database.Article.feed_id == feedId, database.Article.guid_hash == guidHash)
-            .first()
-        )
-        if not item:
-            raise NoArticleError(f"Not article with guid_hash {guidHash} found for feed {feedId}")
+        # SQLite cannot use an index for a row-value IN, so select by guid_hash and match the feed IDs here
+        guid_hashes = list({guid_hash for _, guid_hash in items})
+        for batch in batched(guid_hashes, max_ids_per_statement):
+            rows = db.query(database.Article.feed_id, database.Article.guid_hash, database.Article.id).filter(
+                database.Article.guid_hash.in_(batch)
+            )
+            ids.update({(feed_id, guid_hash): item_id for feed_id, guid_hash, item_id in rows})
 
-    return item
+    for feed_id, guid_hash in items:
+        if (feed_id, guid_hash) not in ids:
+            raise NoArticleError(f"Not article with guid_hash {guid_hash} found for feed {feed_id}")
+    return [ids[item] for item in items]
 
 
 def get_by_id(item_id: int) -> database.Article:
@@ -242,59 +266,85 @@ def _filter_article_query(
     return items
 
 
-def mark_as_read(item_ids: list[int]) -> int:
-    """Mark aricles as read."""
+def _update_by_ids(item_ids: list[int], values: dict) -> int:
+    """Update the given columns of articles in a single transaction.
+
+    The IDs are sent in batches, so that large lists stay below SQLite's limit on bound parameters.
+
+    :param item_ids: The IDs of the articles to update.
+    :param values: The new column values.
+    :returns: The number of updated articles.
+    """
+    n_items = 0
     with database.get_session() as db:
-        items = db.query(database.Article).filter(database.Article.id.in_(item_ids)).all()
-        for item in items:
-            item.unread = False
-            item.last_modified = int(time.time())
+        for batch in batched(item_ids, max_ids_per_statement):
+            n_items += (
+                db.query(database.Article)
+                .filter(database.Article.id.in_(batch))
+                .update(values, synchronize_session=False)
+            )
         db.commit()
-        return len(items)
+    return n_items
+
+
+def mark_as_read(item_ids: list[int]) -> int:
+    """Mark aricles as read."""
+    return _update_by_ids(item_ids, {"unread": False, "last_modified": now()})
 
 
 def mark_as_unread(item_ids: list[int]) -> int:
     """Mark article as unread."""
-    with database.get_session() as db:
-        items = db.query(database.Article).filter(database.Article.id.in_(item_ids)).all()
-        for item in items:
-            item.unread = True
-            item.last_modified = int(time.time())
-        db.commit()
-        return len(items)
+    return _update_by_ids(item_ids, {"unread": True, "last_modified": now()})
 
 
 def mark_as_starred(item_ids: list[int]) -> int:
     """Mark articles as starred."""
-    with database.get_session() as db:
-        items = db.query(database.Article).filter(database.Article.id.in_(item_ids)).all()
-        for item in items:
-            item.starred = True
-            item.last_modified = int(time.time())
-        db.commit()
-        return len(items)
+    return _update_by_ids(item_ids, {"starred": True, "last_modified": now()})
 
 
 def mark_as_unstarred(item_ids: list[int]) -> int:
     """Mark articles as unstarred."""
+    return _update_by_ids(item_ids, {"starred": False, "last_modified": now()})
+
+
+def _update_by_guid_hash(feed_id: int, guid_hash: str, values: dict) -> int:
+    """Update the given columns of the article with a GUID hash in a feed.
+
+    :param feed_id: The ID of the feed of the article.
+    :param guid_hash: The GUID hash of the article.
+    :param values: The new column values.
+    :returns: The number of updated articles.
+    """
     with database.get_session() as db:
-        items = db.query(database.Article).filter(database.Article.id.in_(item_ids)).all()
-        for item in items:
-            item.starred = False
-            item.last_modified = int(time.time())
+        n_items = (
+            db.query(database.Article)
+            .filter(database.Article.feed_id == feed_id, database.Article.guid_hash == guid_hash)
+            .update(values, synchronize_session=False)
+        )
         db.commit()
-        return len(items)
+    return n_items
+
+
+def mark_as_starred_by_guid_hash(feed_id: int, guid_hash: str) -> int:
+    """Mark an article identified by its feed and GUID hash as starred."""
+    return _update_by_guid_hash(feed_id, guid_hash, {"starred": True, "last_modified": now()})
+
+
+def mark_as_unstarred_by_guid_hash(feed_id: int, guid_hash: str) -> int:
+    """Mark an article identified by its feed and GUID hash as unstarred."""
+    return _update_by_guid_hash(feed_id, guid_hash, {"starred": False, "last_modified": now()})
 
 
 def mark_all_as_read(newest_item_id: int) -> int:
     """Mark all items as read until the specified item ID."""
     with database.get_session() as db:
-        items = db.query(database.Article).filter(database.Article.id <= newest_item_id).all()
-        for item in items:
-            item.unread = False
-            item.last_modified = int(time.time())
+        n_items = (
+            db.query(database.Article)
+            .filter(database.Article.id <= newest_item_id, database.Article.unread)
+            .update({"unread": False, "last_modified": now()}, synchronize_session=False)
+        )
         db.commit()
-        return len(items)
+        return n_items
 
 
 def enrich(article: database.Article, download_fulltext: bool, add_llm_summary: bool) -> database.Article:
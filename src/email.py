@@ -258,65 +258,67 @@ def process_email(raw_email) -> None:  # noqa: C901
     feed_title = _extract_feed_title(msg)
     logger.info(f"Identified mailing list email: Subject='{subject}', List='{feed_title}'")
 
+    # The session is only held for the queries, not while the content is parsed and possibly sent to the LLM
     with get_session() as session:
         # Check if a feed exists for this mailing list
         existing_feed = session.query(database.Feed).filter(database.Feed.url == from_address).first()
 
-        if not existing_feed:
-            logger.info(f"No existing feed found for '{from_address}'. Creating new feed.")
-            # Assuming folder_id=1 is a default/root folder. Adjust as needed.
-            # We might need a better way to determine the folder.
+    if not existing_feed:
+        logger.info(f"No existing feed found for '{from_address}'. Creating new feed.")
+        # Assuming folder_id=1 is a default/root folder. Adjust as needed.
+        # We might need a better way to determine the folder.
 
-            new_feed = feed.add_mailing_list(
-                from_address=from_address, title=feed_title, folder_id=folder.get_root_folder_id()
-            )
-            logger.info(f"Created new feed '{feed_title}' with ID {new_feed.id}")
-            feed_id = new_feed.id
-        else:
-            logger.debug(f"Found existing feed '{from_address}' with ID {existing_feed.id}")
-            feed_id = existing_feed.id
-
-        # Extract content (this might need refinement based on email structure)
-        content = ""
-        if msg.is_multipart():
+        new_feed = feed.add_mailing_list(
+            from_address=from_address, title=feed_title, folder_id=folder.get_root_folder_id()
+        )
+        logger.info(f"Created new feed '{feed_title}' with ID {new_feed.id}")
+        feed_id = new_feed.id
+    else:
+        logger.debug(f"Found existing feed '{from_address}' with ID {existing_feed.id}")
+        feed_id = existing_feed.id
+
+    # Extract content (this might need refinement based on email structure)
+    content = ""
+    if msg.is_multipart():
+        for part in msg.walk():
+            content_type = part.get_content_type()
+            content_disposition = str(part.get("Content-Disposition"))
+            if content_type == "text/html" and "attachment" not in content_disposition:
+                content = part.get_payload(decode=True)  # type: ignore
+                break  # Prefer html text
+        if not content:  # Fallback to plain
             for part in msg.walk():
                 content_type = part.get_content_type()
                 content_disposition = str(part.get("Content-Disposition"))
-                if content_type == "text/html" and "attachment" not in content_disposition:
+                if content_type == "text/plain" and "attachment" not in content_disposition:
                     content = part.get_payload(decode=True)  # type: ignore
-                    break  # Prefer html text
-            if not content:  # Fallback to plain
-                for part in msg.walk():
-                    content_type = part.get_content_type()
-                    content_disposition = str(part.get("Content-Disposition"))
-                    if content_type == "text/plain" and "attachment" not in content_disposition:
-                        content = part.get_payload(decode=True)  # type: ignore
-                        break
-        else:
-            content = msg.get_payload(decode=True)  # type: ignore
-
-        # Ensure content is a string
-        if isinstance(content, bytes):
-            # Attempt decoding with message charset or fallback to utf-8
-            charset = msg.get_content_charset() or "utf-8"
-            try:
-                content = content.decode(charset, errors="replace")
-            except LookupError, UnicodeDecodeError:
-                content = content.decode("utf-8", errors="replace")  # Fallback
-        elif not isinstance(content, str):
-            content = str(content)  # Convert other types to string
-
-        # Clean HTML content for better readability in RSS readers
-        if content and content.strip().startswith("<"):
-            content = _clean_newsletter_html(content)
-
-        new_articles = _create_articles_from_email(
-            feed_id=feed_id,
-            subject=subject,
-            from_address=from_address,
-            content=content,
-        )
-        added_count = 0
+                    break
+    else:
+        content = msg.get_payload(decode=True)  # type: ignore
+
+    # Ensure content is a string
+    if isinstance(content, bytes):
+        # Attempt decoding with message charset or fallback to utf-8
+        charset = msg.get_content_charset() or "utf-8"
+        try:
+            content = content.decode(charset, errors="replace")
+        except LookupError, UnicodeDecodeError:
+            content = content.decode("utf-8", errors="replace")  # Fallback
+    elif not isinstance(content, str):
+        content = str(content)  # Convert other types to string
+
+    # Clean HTML content for better readability in RSS readers
+    if content and content.strip().startswith("<"):
+        content = _clean_newsletter_html(content)
+
+    new_articles = _create_articles_from_email(
+        feed_id=feed_id,
+        subject=subject,
+        from_address=from_address,
+        content=content,
+    )
+    added_count = 0
+    with database.article_insert_lock, get_session() as session:
         for new_article in new_articles:
             existing_article = session.query(database.Article).filter_by(guid_hash=new_article.guid_hash).first()
             if existing_article:
@@ -325,7 +327,8 @@ def process_email(raw_email) -> None:  # noqa: C901
             added_count += 1
         if added_count:
             session.commit()
-            logger.info(f"Added {added_count} email article(s) for '{subject}' to feed '{feed_title}'")
+    if added_count:
+        logger.info(f"Added {added_count} email article(s) for '{subject}' to feed '{feed_title}'")
 
 
 def _extract_sender_address(msg) -> str:
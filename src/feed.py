@@ -1,9 +1,11 @@
 import logging
 import random
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from time import mktime
 
 import feedparser
+from sqlalchemy.exc import IntegrityError
 
 from src import article, database, email
 from src.content import (
@@ -20,6 +22,12 @@ twelve_hours = 43_200
 one_day = 86_400
 one_month = 30 * one_day
 
+# Feeds are fetched in parallel, but with a bound to avoid hammering the network and the database.
+max_concurrent_updates = 16
+
+# Number of entries stored per feed update; a new feed only gets a smaller first batch.
+max_articles_per_update = 50
+
 
 class NoFeedError(Exception):
     """Raised when a feed is not found in the database."""
@@ -72,7 +80,7 @@ def _check_fulltext_quality(
     return extracted_length >= 2 * feed_length
 
 
-def _maybe_check_feed_quality(db: database.Session, feed: database.Feed, entries) -> None:
+def _maybe_check_feed_quality(feed: database.Feed, entries) -> None:
     """Check the quality of the feed's content and summaries, and update feed settings accordingly."""
     if not _needs_quality_check(feed):
         return
@@ -92,7 +100,14 @@ def _maybe_check_feed_quality(db: database.Session, feed: database.Feed, entries
     feed.use_extracted_fulltext = _check_fulltext_quality(extracted_text, feed_content)
     feed.use_llm_summary = feed.use_extracted_fulltext  # for now, only use LLM summary if fulltext can be downloaded
     feed.last_quality_check = now()
-    db.commit()
+    _update_by_id(
+        feed.id,
+        {
+            "use_extracted_fulltext": feed.use_extracted_fulltext,
+            "use_llm_summary": feed.use_llm_summary,
+            "last_quality_check": feed.last_quality_check,
+        },
+    )
     logger.info(
         f"Feed {feed.id} ({feed.title}): Quality check complete. "
         f"use_extracted_fulltext={feed.use_extracted_fulltext}, "
@@ -100,17 +115,15 @@ def _maybe_check_feed_quality(db: database.Session, feed: database.Feed, entries
     )
 
 
-def _create(url: str, folder_id: int) -> database.Feed:
+def _create(url: str, folder_id: int, parsed_feed: feedparser.FeedParserDict) -> database.Feed:
     """Create a new feed in the database.
 
     :param url: The URL of the feed.
     :param folder_id: The ID of the folder to associate with the feed.
+    :param parsed_feed: The feed as fetched from the URL.
     :returns: The created feed.
-    :raises FeedParsingError: If there is an error parsing the feed.
     """
     logger.info(f"Creating feed for URL: {url}")
-    parsed_feed = _parse(url)
-
     return database.Feed(
         url=url,
         title=parsed_feed.feed.title,
@@ -121,87 +134,146 @@ def _create(url: str, folder_id: int) -> database.Feed:
     )
 
 
-def _parse(url: str) -> feedparser.FeedParserDict:
+def _parse(url: str, etag: str | None = None, modified: str | None = None) -> feedparser.FeedParserDict:
     """Parse the feed from the given URL.
 
     :param url: The URL of the feed to parse.
-    :returns: The parsed feed.
+    :param etag: The ETag of the last fetch, to request the feed only if it has changed.
+    :param modified: The Last-Modified header of the last fetch, to request the feed only if it has changed.
+    :returns: The parsed feed. Its `status` is 304 and it has no entries if the feed has not changed.
     :raises FeedParsingError: If there is an error parsing the feed.
     :raises SSRFProtectionError: If the URL is blocked for security reasons.
     """
     # Validate URL for SSRF protection
     validate_url(url)
 
-    parsed_feed = feedparser.parse(url)
+    parsed_feed = feedparser.parse(url, etag=etag, modified=modified)
     if parsed_feed.bozo:
         raise FeedParsingError(f"Error parsing feed from `{url}`: {parsed_feed.bozo_exception}")
     return parsed_feed
 
 
-def update(feed_id: int, max_articles: int = 50) -> None:
+def update(
+    feed_id: int,
+    max_articles: int = max_articles_per_update,
+    parsed_feed: feedparser.FeedParserDict | None = None,
+) -> None:
     """Update the feed with the given ID.
 
     :param feed_id: The ID of the feed to update.
     :param max_articles: The maximum number of articles to update.
+    :param parsed_feed: The feed if it has just been fetched, so that it is not fetched again.
     :raises NoFeedError: If the feed does not exist.
     :raises FeedParsingError: If there is an error parsing the feed.
     """
+    # No connection is held while the feed is fetched and its articles are enriched, as both can take long and the
+    # connection pool is shared with the API requests. The feed is read once and written back column by column.
     with database.get_session() as db:
         feed = db.get(database.Feed, feed_id)
-        if not feed:
-            raise NoFeedError(f"Feed {feed_id} does not exist")
-        logger.info(f"Feed {feed_id} ({feed.title}): Updating feed")
+    if not feed:
+        raise NoFeedError(f"Feed {feed_id} does not exist")
+    logger.info(f"Feed {feed_id} ({feed.title}): Updating feed")
+
+    try:
+        if parsed_feed is None:
+            parsed_feed = _parse(feed.url, etag=feed.http_etag, modified=feed.http_last_modified)
+    except Exception as e:
+        logger.error(f"Error updating feed {feed_id}: {e}")
+        _update_by_id(
+            feed_id, {"update_error_count": database.Feed.update_error_count + 1, "last_update_error": str(e)}
+        )
+        return
+    if feed.update_error_count > 0:
+        _update_by_id(feed_id, {"update_error_count": 0, "last_update_error": None})
+
+    if parsed_feed.get("status") == 304:
+        logger.info(f"Feed {feed_id} ({feed.title}): Feed has not changed since the last update")
+        _update_by_id(feed_id, {"next_update_time": _calculate_next_update_time(feed_id)})
+        return
+
+    _maybe_check_feed_quality(feed=feed, entries=parsed_feed.entries)
 
+    n_failed_articles = 0
+    feed_articles = []
+    for new_article in parsed_feed.entries[:max_articles]:
         try:
-            parsed_feed = _parse(feed.url)
+            feed_articles.append(_create_article(new_article, feed))
         except Exception as e:
-            logger.error(f"Error updating feed {feed_id}: {e}")
-            feed.update_error_count += 1
-            feed.last_update_error = str(e)
-            db.commit()
-            return
-        if feed.update_error_count > 0:
-            feed.update_error_count = 0
-            feed.last_update_error = None
-            db.commit()
-
-        _maybe_check_feed_quality(db=db, feed=feed, entries=parsed_feed.entries)
-
-        feed_article_guid_hashes = []
-        n_new_articles = 0
-
-        for idx, new_article in enumerate(parsed_feed.entries):
-            if idx >= max_articles:
-                break
-            try:
-                db_article = _create_article(new_article, feed)
-                feed_article_guid_hashes.append(db_article.guid_hash)
+            logger.error(f"Error adding article from feed {feed_id}: {e}")
+            n_failed_articles += 1
+    feed_article_guid_hashes = [a.guid_hash for a in feed_articles]
 
-                existing_article = db.query(database.Article).filter_by(guid_hash=db_article.guid_hash).first()
-                if existing_article:
-                    continue
-
-                db_article = article.enrich(
+    # Look up which articles are already stored with a single query instead of one per article
+    with database.get_session() as db:
+        known_guid_hashes = {
+            guid_hash
+            for (guid_hash,) in db.query(database.Article.guid_hash).filter(
+                database.Article.guid_hash.in_(feed_article_guid_hashes)
+            )
+        }
+    new_articles = []
+    for db_article in feed_articles:
+        if db_article.guid_hash in known_guid_hashes:
+            continue
+        known_guid_hashes.add(db_article.guid_hash)
+        try:
+            new_articles.append(
+                article.enrich(
                     article=db_article,
                     download_fulltext=feed.use_extracted_fulltext,
                     add_llm_summary=feed.use_llm_summary,
                 )
-                db.add(db_article)
-                db.commit()
-                n_new_articles += 1
-
-            except Exception as e:
-                logger.error(f"Error adding article from feed {feed_id}: {e}")
-
-        logger.info(
-            f"Feed {feed_id} ({feed.title}): Added {n_new_articles} new articles out of {len(parsed_feed.entries)}"
-        )
-        feed.next_update_time = _calculate_next_update_time(feed_id)
+            )
+        except Exception as e:
+            logger.error(f"Error adding article from feed {feed_id}: {e}")
+            n_failed_articles += 1
+
+    # Enriching is slow, so another feed or mailbox may have stored some of the articles in the meantime
+    n_new_articles = 0
+    with database.article_insert_lock, database.get_session() as db:
+        stored_guid_hashes = {
+            guid_hash
+            for (guid_hash,) in db.query(database.Article.guid_hash).filter(
+                database.Article.guid_hash.in_([a.guid_hash for a in new_articles])
+            )
+        }
+        for db_article in new_articles:
+            if db_article.guid_hash in stored_guid_hashes:
+                continue
+            db.add(db_article)
+            n_new_articles += 1
+        # The new articles are written in one transaction instead of one commit per article
         db.commit()
 
+    logger.info(f"Feed {feed_id} ({feed.title}): Added {n_new_articles} new articles out of {len(parsed_feed.entries)}")
+    # A 304 on the next update skips the feed, so only keep the validators if every entry a regular update would
+    # store has been stored. Otherwise, the skipped entries are picked up by the next full fetch.
+    all_entries_stored = n_failed_articles == 0 and (
+        max_articles >= max_articles_per_update or len(parsed_feed.entries) <= max_articles
+    )
+    _update_by_id(
+        feed_id,
+        {
+            "next_update_time": _calculate_next_update_time(feed_id),
+            "http_etag": parsed_feed.get("etag") if all_entries_stored else None,
+            "http_last_modified": parsed_feed.get("modified") if all_entries_stored else None,
+        },
+    )
+
     clean_up_old_articles(feed_id, feed_article_guid_hashes)
 
 
+def _update_by_id(feed_id: int, values: dict) -> None:
+    """Update the given columns of a feed.
+
+    :param feed_id: The ID of the feed.
+    :param values: The new column values.
+    """
+    with database.get_session() as db:
+        db.query(database.Feed).filter(database.Feed.id == feed_id).update(values, synchronize_session=False)
+        db.commit()
+
+
 def _create_article(new_article, feed: database.Feed) -> database.Article:
     """Create a new article in the database.
 
@@ -256,7 +328,8 @@ def _create_article(new_article, feed: database.Feed) -> database.Article:
 def update_all() -> None:
     """Update all feeds in the database.
 
-    This function fetches all feeds from the database and updates each one.
+    This function fetches all feeds from the database and updates them concurrently.
+    Errors while updating one feed are logged and do not stop the update of the others.
     """
     with database.get_session() as db:
         feeds_to_update = (
@@ -269,10 +342,17 @@ def update_all() -> None:
         )
     logger.info(f"Updating {len(feeds_to_update)} feeds")
 
-    for feed in feeds_to_update:
-        update(feed.id)
+    with ThreadPoolExecutor(max_workers=max_concurrent_updates) as executor:
+        # Newsletters are fetched from the mailboxes while the feeds are updated
+        mailbox_fetch = executor.submit(email.fetch_emails_from_all_mailboxes)
+        futures = {executor.submit(update, feed.id): feed.id for feed in feeds_to_update}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"Error updating feed {futures[future]}: {e}")
 
-    email.fetch_emails_from_all_mailboxes()
+    mailbox_fetch.result()
     logger.info("Finished updating all feeds")
 
 
@@ -346,33 +426,39 @@ def add(url: str, folder_id: int) -> database.Feed:
     :raises FeedParsingError: If there is an error parsing the feed.
     """
     with database.get_session() as db:
-        existing_feed = db.query(database.Feed).filter(database.Feed.url == url).first()
-        if existing_feed:
+        if db.query(database.Feed.id).filter(database.Feed.url == url).first():
             raise FeedExistsError("Feed already exists")
 
-        folder = db.query(database.Folder).filter(database.Folder.id == folder_id).first()
-        if not folder:
+        if not db.query(database.Folder.id).filter(database.Folder.id == folder_id).first():
             raise NoFolderError(f"Folder with ID {folder_id} does not exist")
 
-    new_feed = _create(url=url, folder_id=folder_id)
+    parsed_feed = _parse(url)
+    new_feed = _create(url=url, folder_id=folder_id, parsed_feed=parsed_feed)
     with database.get_session() as db:
         db.add(new_feed)
+        # The same feed may have been added while it was fetched
+        try:
+            db.flush()
+        except IntegrityError:
+            raise FeedExistsError("Feed already exists") from None
+        new_feed_id = new_feed.id
         db.commit()
-        db.refresh(new_feed)
 
-    update(new_feed.id, max_articles=10)
-    return new_feed
+    # Store the first articles from the response that was already fetched to create the feed
+    update(new_feed_id, max_articles=10, parsed_feed=parsed_feed)
+
+    # Reload the feed, so that the returned object includes the changes made by the first update.
+    with database.get_session() as db:
+        return db.get_one(database.Feed, new_feed_id)
 
 
 def add_mailing_list(from_address: str, title: str, folder_id: int) -> database.Feed:
     """Add a new mailing list feed."""
     with database.get_session() as db:
-        existing_feed = db.query(database.Feed).filter(database.Feed.url == from_address).first()
-        if existing_feed:
+        if db.query(database.Feed.id).filter(database.Feed.url == from_address).first():
             raise FeedExistsError("Feed already exists")
 
-        folder = db.query(database.Folder).filter(database.Folder.id == folder_id).first()
-        if not folder:
+        if not db.query(database.Folder.id).filter(database.Folder.id == folder_id).first():
             raise NoFolderError(f"Folder with ID {folder_id} does not exist")
 
     new_feed = database.Feed(
@@ -399,15 +485,10 @@ def delete(feed_id: int) -> None:
     :raises NoFeedError: If the feed does not exist.
     """
     with database.get_session() as db:
-        feed = db.query(database.Feed).filter(database.Feed.id == feed_id).first()
-        if not feed:
+        # Delete the feed, and its articles only if the feed exists
+        if not db.query(database.Feed).filter(database.Feed.id == feed_id).delete():
             raise NoFeedError(f"Feed {feed_id} not found")
-
-        # Delete associated articles
         db.query(database.Article).filter(database.Article.feed_id == feed_id).delete()
-
-        # Delete the feed
-        db.delete(feed)
         db.commit()
 
 
@@ -420,17 +501,13 @@ def move_to_folder(feed_id: int, folder_id: int) -> None:
     :raises NoFolderError: If the folder does not exist.
     """
     with database.get_session() as db:
-        feed = db.query(database.Feed).filter(database.Feed.id == feed_id).first()
-        if not feed:
+        if not db.query(database.Feed).filter(database.Feed.id == feed_id).update({"folder_id": folder_id}):
             raise NoFeedError(f"Feed {feed_id} not found")
 
-        folder = db.query(database.Folder).filter(database.Folder.id == folder_id).first()
-        if not folder:
+        # The update is rolled back when the session closes without a commit
+        if not db.query(database.Folder.id).filter(database.Folder.id == folder_id).first():
             raise NoFolderError(f"Folder with ID {folder_id} does not exist")
-
-        feed.folder_id = folder_id
         db.commit()
-        db.refresh(feed)
 
 
 def rename(feed_id: int, new_title: str) -> None:
@@ -441,13 +518,9 @@ def rename(feed_id: int, new_title: str) -> None:
     :raises NoFeedError: If the feed does not exist.
     """
     with database.get_session() as db:
-        feed = db.query(database.Feed).filter(database.Feed.id == feed_id).first()
-        if not feed:
+        if not db.query(database.Feed).filter(database.Feed.id == feed_id).update({"title": new_title}):
             raise NoFeedError(f"Feed {feed_id} not found")
-
-        feed.title = new_title
         db.commit()
-        db.refresh(feed)
 
 
 def clean_up_old_articles(feed_id: int, feed_guid_hashes: list[str]) -> None:
@@ -1,5 +1,7 @@
 import logging
 
+from sqlalchemy.exc import IntegrityError
+
 from src import database
 
 logger = logging.getLogger(__name__)
@@ -37,12 +39,6 @@ def create(name: str) -> database.Folder:
     """
     logger.info(f"Creating folder with name `{name}`")
 
-    with database.get_session() as db:
-        existing_folder = db.query(database.Folder).filter(database.Folder.name == name).first()
-    if existing_folder:
-        logger.error(f"Folder with name {name} already exists.")
-        raise FolderExistsError("Folder already exists")
-
     if not name:
         logger.error("Folder name is invalid (empty).")
         raise InvalidFolderNameError("Folder name is invalid")
@@ -50,7 +46,12 @@ def create(name: str) -> database.Folder:
     with database.get_session() as db:
         new_folder = database.Folder(name=name)
         db.add(new_folder)
-        db.commit()
+        # Rely on the unique constraint on the name instead of checking for an existing folder first
+        try:
+            db.commit()
+        except IntegrityError:
+            logger.error(f"Folder with name {name} already exists.")
+            raise FolderExistsError("Folder already exists") from None
         db.refresh(new_folder)
 
     return new_folder
@@ -67,12 +68,10 @@ def delete(folder_id: int):
     :raises NoFolderError: If the folder is not found.
     """
     with database.get_session() as db:
-        folder = db.query(database.Folder).filter(database.Folder.id == folder_id).first()
-        if not folder:
+        if not db.query(database.Folder).filter(database.Folder.id == folder_id).delete():
             logger.info(f"Failed to delete non-existing folder with ID `{folder_id}`")
             raise NoFolderError("Folder not found.")
         db.query(database.Feed).filter(database.Feed.folder_id == folder_id).delete()
-        db.delete(folder)
         db.commit()
         logger.info(f"Successfully deleted folder with ID `{folder_id}`")
 
@@ -89,12 +88,11 @@ def rename(folder_id: int, new_name: str):
     """
     logger.info(f"Renaming folder with ID {folder_id} to `{new_name}`")
     with database.get_session() as db:
-        folder = db.query(database.Folder).filter(database.Folder.id == folder_id).first()
-        if not folder:
+        if not db.query(database.Folder.id).filter(database.Folder.id == folder_id).first():
             raise NoFolderError("Folder not found")
 
-        existing_folder = db.query(database.Folder).filter(database.Folder.name == new_name).first()
-        if existing_folder:
+        # Renaming a folder to its current name also counts as a duplicate
+        if db.query(database.Folder.id).filter(database.Folder.name == new_name).first():
             logger.error(f"Folder with name {new_name} already exists.")
             raise FolderExistsError("Folder already exists")
 
@@ -102,7 +100,12 @@ def rename(folder_id: int, new_name: str):
             logger.error("Folder name is invalid (empty).")
             raise InvalidFolderNameError("Folder name is invalid")
 
-        folder.name = new_name
+        # The unique constraint on the name still catches a folder created with the same name in the meantime
+        try:
+            db.query(database.Folder).filter(database.Folder.id == folder_id).update({"name": new_name})
+        except IntegrityError:
+            logger.error(f"Folder with name {new_name} already exists.")
+            raise FolderExistsError("Folder already exists") from None
         db.commit()
 
 
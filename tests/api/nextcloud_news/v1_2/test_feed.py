@@ -1,5 +1,7 @@
 from typing import TYPE_CHECKING
 
+from src.feed import now
+
 if TYPE_CHECKING:
     from fastapi.testclient import TestClient
 
@@ -181,6 +183,30 @@ def test_mark_items_read(client: TestClient, feed_server) -> None:
     assert items[0]["unread"] is False
 
 
+def test_mark_items_read_updates_last_modified(client: TestClient, feed_server, monkeypatch) -> None:
+    # given
+    response = client.post(
+        "/feeds",
+        json={
+            "url": feed_server.url_for("/atom.xml"),
+            "folderId": None,
+        },
+    )
+    feed_id = response.json()["feeds"][0]["id"]
+    newest_item_id = client.get("/items", params={"type": 0, "id": feed_id}).json()["items"][0]["id"]
+    timestamp = now() + 60
+    monkeypatch.setattr("src.article.now", lambda: timestamp)
+
+    # when
+    client.put(f"/feeds/{feed_id}/read", json={"newestItemId": newest_item_id})
+
+    # then
+    response = client.get("/items/updated", params={"lastModified": timestamp, "type": 0, "id": feed_id})
+    items = response.json()["items"]
+    assert len(items) == 1
+    assert items[0]["unread"] is False
+
+
 def test_feed_creation_with_folder_id_zero(client: TestClient, feed_server) -> None:
     # when
     response = client.post(
@@ -220,3 +246,16 @@ def test_next_update_time_calculation(client: TestClient, feed_server) -> None:
     assert response.status_code == 200
     assert len(feeds) == 1
     assert feeds[0]["nextUpdateTime"] is not None
+
+
+def test_feed_creation_returns_only_new_feed(client: TestClient, feed_server) -> None:
+    # given
+    client.post("/feeds", json={"url": feed_server.url_for("/atom.xml"), "folderId": None})
+    # when
+    response = client.post("/feeds", json={"url": feed_server.url_for("/rss_2_0.xml"), "folderId": None})
+    # then
+    assert response.status_code == 200
+    feeds = response.json()["feeds"]
+    assert len(feeds) == 1
+    assert feeds[0]["url"] == feed_server.url_for("/rss_2_0.xml")
+    assert feeds[0]["nextUpdateTime"] is not None
@@ -1,5 +1,7 @@
 from typing import TYPE_CHECKING
 
+from src.feed import now
+
 if TYPE_CHECKING:
     from fastapi.testclient import TestClient
 
@@ -184,6 +186,42 @@ def test_rename_folder_invalid_name(client: TestClient) -> None:
     assert response.json()["detail"] == "Folder name is invalid"
 
 
+def test_rename_folder_to_current_name(client: TestClient) -> None:
+    # given
+    response = client.post(
+        "/folders",
+        json={
+            "name": "Media",
+        },
+    )
+    folder_id = response.json()["folders"][0]["id"]
+
+    # when
+    response = client.put(
+        f"/folders/{folder_id}",
+        json={
+            "name": "Media",
+        },
+    )
+
+    # then
+    assert response.status_code == 409
+    assert response.json()["detail"] == "Folder already exists"
+
+
+def test_rename_non_existent_folder_with_invalid_name(client: TestClient) -> None:
+    # when
+    response = client.put(
+        "/folders/999",
+        json={
+            "name": "",
+        },
+    )
+
+    # then
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Folder not found"
+
 def test_mark_items_read(client: TestClient, feed_server) -> None:
     # given
     response = client.post(
@@ -217,3 +255,28 @@ def test_mark_items_read(client: TestClient, feed_server) -> None:
     items = response.json()["items"]
     assert len(items) == 1
     assert items[0]["unread"] is False
+
+
+def test_mark_items_read_updates_last_modified(client: TestClient, feed_server, monkeypatch) -> None:
+    # given
+    response = client.post("/folders", json={"name": "Media"})
+    folder_id = response.json()["folders"][0]["id"]
+    client.post(
+        "/feeds",
+        json={
+            "url": feed_server.url_for("/atom.xml"),
+            "folderId": folder_id,
+        },
+    )
+    newest_item_id = client.get("/items", params={"type": 1, "id": folder_id}).json()["items"][0]["id"]
+    timestamp = now() + 60
+    monkeypatch.setattr("src.article.now", lambda: timestamp)
+
+    # when
+    client.post(f"/folders/{folder_id}/read", json={"newestItemId": newest_item_id})
+
+    # then
+    response = client.get("/items/updated", params={"lastModified": timestamp, "type": 1, "id": folder_id})
+    items = response.json()["items"]
+    assert len(items) == 1
+    assert items[0]["unread"] is False
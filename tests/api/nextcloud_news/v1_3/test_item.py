@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING
 
+from src.article import max_ids_per_statement
 from src.feed import now
 
 if TYPE_CHECKING:
@@ -64,6 +65,14 @@ def test_get_updated_items(client: TestClient, feed_server) -> None:
     assert len(items) == 1
 
 
+def test_get_items_with_unknown_type(client: TestClient) -> None:
+    # when
+    response = client.get("/items", params={"type": 4, "id": 0})
+
+    # then
+    assert response.status_code == 422
+
+
 def test_get_item_content(client: TestClient, feed_server) -> None:
     # given
     response = client.post(
@@ -142,6 +151,30 @@ def test_mark_multiple_items_as_read(client: TestClient, feed_server) -> None:
     assert items[0]["lastModified"] is not None  # P4fad
 
 
+def test_mark_many_items_as_read(client: TestClient, feed_server) -> None:
+    # given
+    for path in ["/atom.xml", "/rss_2_0.xml"]:
+        client.post("/feeds", json={"url": feed_server.url_for(path), "folderId": None})
+    item_ids = [item["id"] for item in client.get("/items", params={"type": 3}).json()["items"]]
+    # Unknown ids in between put the real ones into different batches of the update
+    filler_ids = list(range(max(item_ids) + 1, max(item_ids) + 1 + max_ids_per_statement))
+
+    # when
+    response = client.post(
+        "/items/read/multiple",
+        json={
+            "itemIds": [item_ids[0], *filler_ids, *item_ids[1:]],
+        },
+    )
+
+    # then
+    assert response.status_code == 200
+    response = client.get("/items", params={"type": 3})
+    items = response.json()["items"]
+    assert len(items) == len(item_ids) > 1
+    assert all(item["unread"] is False for item in items)
+
+
 def test_mark_item_as_unread(client: TestClient, feed_server) -> None:
     # given
     response = client.post(
@@ -0,0 +1,119 @@
+from pathlib import Path
+from unittest.mock import patch
+
+from src import article, database, feed, folder
+
+
+def test_update_all_updates_every_due_feed(feed_server) -> None:
+    # given
+    root_folder_id = folder.get_root_folder_id()
+    feed_ids = [feed.add(feed_server.url_for(path), root_folder_id).id for path in ["/atom.xml", "/rss_2_0.xml"]]
+    with database.get_session() as db:
+        db.query(database.Feed).update({database.Feed.next_update_time: None})
+        db.commit()
+    # when
+    with patch("src.feed.update", wraps=feed.update) as update:
+        feed.update_all()
+    # then
+    assert sorted(call.args[0] for call in update.call_args_list) == sorted(feed_ids)
+    assert all(f.next_update_time is not None for f in feed.get_all())
+
+
+def test_update_all_continues_after_failing_feed(feed_server) -> None:
+    # given
+    root_folder_id = folder.get_root_folder_id()
+    failing_feed = feed.add(feed_server.url_for("/atom.xml"), root_folder_id)
+    working_feed = feed.add(feed_server.url_for("/rss_2_0.xml"), root_folder_id)
+    with database.get_session() as db:
+        db.query(database.Feed).update({database.Feed.next_update_time: None})
+        db.commit()
+    original_update = feed.update
+
+    def update(feed_id: int) -> None:
+        if feed_id == failing_feed.id:
+            raise feed.NoFeedError(f"Feed {feed_id} does not exist")
+        original_update(feed_id)
+
+    # when
+    with patch("src.feed.update", side_effect=update):
+        feed.update_all()
+    # then
+    with database.get_session() as db:
+        assert db.get(database.Feed, working_feed.id).next_update_time is not None
+
+
+def test_update_skips_unchanged_feed(httpserver) -> None:
+    # given
+    feed_xml = (Path(__file__).parent / "fixtures/feeds/atom.xml").read_text()
+    httpserver.expect_request("/etag.xml", headers={"If-None-Match": '"v1"'}).respond_with_data("", status=304)
+    httpserver.expect_request("/etag.xml").respond_with_data(
+        feed_xml, content_type="application/xml", headers={"ETag": '"v1"'}
+    )
+    new_feed = feed.add(httpserver.url_for("/etag.xml"), folder.get_root_folder_id())
+    n_articles = len(article.get_by_feed(new_feed.id))
+    # when
+    feed.update(new_feed.id)
+    # then
+    assert httpserver.log[-1][1].status_code == 304
+    assert new_feed.http_etag == '"v1"'
+    assert len(article.get_by_feed(new_feed.id)) == n_articles
+
+
+def test_add_fetches_feed_once(httpserver) -> None:
+    # given
+    feed_xml = (Path(__file__).parent / "fixtures/feeds/atom.xml").read_text()
+    httpserver.expect_request("/atom.xml").respond_with_data(feed_xml, content_type="application/xml")
+    # when
+    new_feed = feed.add(httpserver.url_for("/atom.xml"), folder.get_root_folder_id())
+    # then
+    assert len(httpserver.log) == 1
+    assert len(article.get_by_feed(new_feed.id)) > 0
+
+
+def test_update_after_add_stores_remaining_articles(httpserver) -> None:
+    # given
+    entries = "".join(
+        f"<entry><title>Entry {i}</title><link href='/entry/{i}'/><id>tag:example.org,2024:/entry/{i}</id>"
+        f"<updated>2024-01-30T12:34:56Z</updated></entry>"
+        for i in range(15)
+    )
+    feed_xml = (
+        "<?xml version='1.0' encoding='utf-8'?><feed xmlns='http://www.w3.org/2005/Atom'>"
+        f"<title>Long Feed</title><id>tag:example.org,2024:/feed</id>{entries}</feed>"
+    )
+    httpserver.expect_request("/long.xml", headers={"If-None-Match": '"v1"'}).respond_with_data("", status=304)
+    httpserver.expect_request("/long.xml").respond_with_data(
+        feed_xml, content_type="application/xml", headers={"ETag": '"v1"'}
+    )
+    new_feed = feed.add(httpserver.url_for("/long.xml"), folder.get_root_folder_id())
+    assert len(article.get_by_feed(new_feed.id)) == 10
+    # when
+    feed.update(new_feed.id)
+    # then
+    assert httpserver.log[-1][1].status_code == 200
+    assert len(article.get_by_feed(new_feed.id)) == 15
+
+
+def test_update_holds_no_connection_while_fetching(feed_server) -> None:
+    # given
+    new_feed = feed.add(feed_server.url_for("/atom.xml"), folder.get_root_folder_id())
+    with database.get_session() as db:
+        db.query(database.Article).delete()
+        db.commit()
+    parse, enrich = feed._parse, article.enrich
+    checked_out_connections = []
+
+    def record_parse(*args, **kwargs):
+        checked_out_connections.append(database._engine.pool.checkedout())
+        return parse(*args, **kwargs)
+
+    def record_enrich(*args, **kwargs):
+        checked_out_connections.append(database._engine.pool.checkedout())
+        return enrich(*args, **kwargs)
+
+    # when
+    with patch("src.feed._parse", side_effect=record_parse), patch("src.article.enrich", side_effect=record_enrich):
+        feed.update(new_feed.id)
+    # then
+    assert checked_out_connections == [0, 0]
+    assert len(article.get_by_feed(new_feed.id)) == 1